@@ -11,7 +11,7 @@ import hashlib
 import json
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from powermem.utils.utils import get_current_datetime
 from copy import deepcopy
 
@@ -37,6 +37,7 @@ from ..utils.utils import (
     llm_json_text_with_fallback,
     parse_fact_extraction_json,
     parse_memory_actions_json,
+    parse_created_at,
 )
 from ..utils.io import export_to_json, export_to_csv, import_from_json, import_from_csv
 from ..prompts.intelligent_memory_prompts import (
@@ -1129,56 +1130,183 @@ class Memory(MemoryBase):
             self.telemetry.capture_event("memory.add.error", {"error": str(e)})
             raise
     
-    def _simple_add(
+    @staticmethod
+    def _parse_message_content(messages) -> str:
+        """Parse messages (str, dict, or list[dict]) into a content string."""
+        if isinstance(messages, str):
+            return messages
+        if isinstance(messages, dict):
+            return messages.get("content", "")
+        if isinstance(messages, list):
+            return "\n".join([
+                msg.get("content", "")
+                for msg in messages
+                if isinstance(msg, dict) and msg.get("content")
+            ])
+        raise ValueError("messages must be str, dict, or list[dict]")
+
+    def add_batch(
         self,
-        messages,
+        messages_list: List[Any],
         user_id: Optional[str] = None,
         agent_id: Optional[str] = None,
         run_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None,
+        metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None,
         filters: Optional[Dict[str, Any]] = None,
         scope: Optional[str] = None,
         memory_type: Optional[str] = None,
-        prompt: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Simple add mode: direct storage without intelligence.
-        
+        """Add multiple memories in one pass without LLM inference.
+
+        Embeddings for the whole batch are generated with a single
+        embed_batch call per embedding service (embedding backends are
+        heavily vectorized, so one call with N texts is far cheaper than
+        N calls), then each item is stored via the simple-add path with
+        its precomputed embedding.
+
+        Args:
+            messages_list: One messages value (str, dict, or list[dict]) per item
+            user_id: Common user ID for all items
+            agent_id: Common agent ID for all items
+            run_id: Common run ID for all items
+            metadata_list: Optional per-item metadata, aligned with messages_list
+            filters: Common filters for all items
+            scope: Common scope for all items
+            memory_type: Common memory type for all items
+
         Returns:
-            Dict[str, Any]: A dictionary containing the add operation results with the following structure:
-                - "results" (List[Dict]): List containing a single memory operation result with:
-                    - "id" (int): Memory ID
-                    - "memory" (str): The memory content
-                    - "event" (str): Operation event type ("ADD")
-                    - "user_id" (str, optional): User ID associated with the memory
-                    - "agent_id" (str, optional): Agent ID associated with the memory
-                    - "run_id" (str, optional): Run ID associated with the memory
-                    - "metadata" (Dict, optional): Metadata dictionary
-                    - "created_at" (str): Creation timestamp in ISO format
-                - "relations" (Dict, optional): Graph relations if graph store is enabled, containing:
-                    - "deleted_entities" (List): List of deleted graph entities
-                    - "added_entities" (List): List of added graph entities
+            Dict[str, Any]: {"results": [...]} with one result per input
+            item, in input order (same shape as add with infer=False)
         """
-        # Parse messages into content
-        if isinstance(messages, str):
-            content = messages
-        elif isinstance(messages, dict):
-            content = messages.get("content", "")
-        elif isinstance(messages, list):
-            content = "\n".join([msg.get("content", "") for msg in messages if isinstance(msg, dict) and msg.get("content")])
-        else:
-            raise ValueError("messages must be str, dict, or list[dict]")
-        
-        # Validate content is not empty
-        if not content or not content.strip():
-            logger.error(f"Cannot store empty content. Messages: {messages}")
-            raise ValueError(f"Cannot create memory with empty content. Original messages: {messages}")
-        
-        # Select embedding service based on metadata (for sub-store routing)
-        embedding_service = self._get_embedding_service(metadata)
+        if metadata_list is None:
+            metadata_list = [None] * len(messages_list)
+        if len(metadata_list) != len(messages_list):
+            raise ValueError("metadata_list must align with messages_list")
+
+        # HTTP fallback mode (embedded SeekDB unavailable) has no local
+        # embedding or storage; delegate per item through the client like
+        # the other public methods do
+        http_client = getattr(self, "_http_client", None)
+        if http_client:
+            results: List[Dict[str, Any]] = []
+            for messages, metadata in zip(messages_list, metadata_list):
+                result = http_client.add(
+                    messages,
+                    user_id=user_id,
+                    agent_id=agent_id or self.agent_id,
+                    run_id=run_id,
+                    metadata=metadata,
+                    filters=filters,
+                    scope=scope,
+                    memory_type=memory_type,
+                    infer=False,
+                )
+                results.extend(result.get("results", []))
+            return {"results": results}
 
-        # Generate embedding
-        embedding = embedding_service.embed(content, memory_action="add")
-        
+        # Parse and validate up front so embedding work is not wasted
+        contents = [self._parse_message_content(m) for m in messages_list]
+        for messages, content in zip(messages_list, contents):
+            if not content or not content.strip():
+                raise ValueError(
+                    f"Cannot create memory with empty content. Original messages: {messages}"
+                )
+
+        # Group by embedding service (sub-store routing may select
+        # different services per metadata) and batch-embed each group
+        embeddings: List[Optional[List[float]]] = [None] * len(contents)
+        service_groups: Dict[int, Any] = {}
+        group_indexes: Dict[int, List[int]] = {}
+        for i, metadata in enumerate(metadata_list):
+            service = self._get_embedding_service(metadata)
+            key = id(service)
+            service_groups[key] = service
+            group_indexes.setdefault(key, []).append(i)
+
+        for key, indexes in group_indexes.items():
+            service = service_groups[key]
+            vectors = service.embed_batch(
+                [contents[i] for i in indexes], memory_action="add"
+            )
+            for i, vector in zip(indexes, vectors):
+                embeddings[i] = vector
+
+        # Graph updates are inherently per-item; keep the simple-add loop
+        # when the graph store is enabled
+        if self.enable_graph:
+            results: List[Dict[str, Any]] = []
+            for messages, metadata, embedding in zip(messages_list, metadata_list, embeddings):
+                result = self._simple_add(
+                    messages,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    run_id=run_id,
+                    metadata=metadata,
+                    filters=filters,
+                    scope=scope,
+                    memory_type=memory_type,
+                    precomputed_embedding=embedding,
+                )
+                results.extend(result.get("results", []))
+            return {"results": results}
+
+        # Bulk path: build every storage row, then insert the whole batch
+        # in one vector-store round-trip per chunk instead of one per item
+        agent_id = agent_id or self.agent_id
+        rows = [
+            self._prepare_memory_data(
+                content, embedding, user_id, agent_id, run_id,
+                metadata, filters, scope, memory_type,
+            )
+            for content, metadata, embedding in zip(contents, metadata_list, embeddings)
+        ]
+        memory_ids = self.storage.add_memories(rows)
+
+        self.audit.log_event("memory.add_batch", {
+            "count": len(memory_ids),
+            "user_id": user_id,
+            "agent_id": agent_id
+        }, user_id=user_id, agent_id=agent_id)
+
+        self.telemetry.capture_event("memory.add_batch", {
+            "count": len(memory_ids),
+            "user_id": user_id,
+            "agent_id": agent_id
+        })
+
+        results = [
+            {
+                "id": memory_id,
+                "memory": content,
+                "event": "ADD",
+                "user_id": user_id,
+                "agent_id": agent_id,
+                "run_id": run_id,
+                "metadata": metadata,
+                "created_at": row["created_at"].isoformat() if isinstance(row["created_at"], datetime) else row["created_at"],
+            }
+            for memory_id, content, metadata, row in zip(memory_ids, contents, metadata_list, rows)
+        ]
+        return {"results": results}
+
+    def _prepare_memory_data(
+        self,
+        content: str,
+        embedding: List[float],
+        user_id: Optional[str],
+        agent_id: Optional[str],
+        run_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        filters: Optional[Dict[str, Any]],
+        scope: Optional[str],
+        memory_type: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build the storage row for a simple add (no LLM inference).
+
+        Applies plugin annotations, content hashing, and the
+        category/scope metadata munging shared by _simple_add and
+        add_batch.
+        """
         # Disabled LLM-based importance evaluation to save tokens
         # Process with intelligence manager
         # enhanced_metadata = self.intelligence.process_metadata(content, metadata)
@@ -1213,15 +1341,7 @@ class Memory(MemoryBase):
             else:
                 enhanced_metadata = {"scope": scope}
 
-        # Final validation before storage
-        if not content or not content.strip():
-            raise ValueError(f"Refusing to store empty content. Original messages: {messages}")
-        
-        # Use self.agent_id as fallback if agent_id is not provided
-        agent_id = agent_id or self.agent_id
-        
-        # Store in database
-        memory_data = {
+        return {
             "content": content,
             "embedding": embedding,
             "user_id": user_id,
@@ -1235,6 +1355,68 @@ class Memory(MemoryBase):
             "updated_at": get_current_datetime(),
         }
 
+    def _simple_add(
+        self,
+        messages,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        scope: Optional[str] = None,
+        memory_type: Optional[str] = None,
+        prompt: Optional[str] = None,
+        precomputed_embedding: Optional[List[float]] = None,
+    ) -> Dict[str, Any]:
+        """Simple add mode: direct storage without intelligence.
+
+        When precomputed_embedding is provided (e.g. from a batched
+        embed call in add_batch), the per-item embedding request is skipped.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing the add operation results with the following structure:
+                - "results" (List[Dict]): List containing a single memory operation result with:
+                    - "id" (int): Memory ID
+                    - "memory" (str): The memory content
+                    - "event" (str): Operation event type ("ADD")
+                    - "user_id" (str, optional): User ID associated with the memory
+                    - "agent_id" (str, optional): Agent ID associated with the memory
+                    - "run_id" (str, optional): Run ID associated with the memory
+                    - "metadata" (Dict, optional): Metadata dictionary
+                    - "created_at" (str): Creation timestamp in ISO format
+                - "relations" (Dict, optional): Graph relations if graph store is enabled, containing:
+                    - "deleted_entities" (List): List of deleted graph entities
+                    - "added_entities" (List): List of added graph entities
+        """
+        # Parse messages into content
+        content = self._parse_message_content(messages)
+
+        # Validate content is not empty
+        if not content or not content.strip():
+            logger.error(f"Cannot store empty content. Messages: {messages}")
+            raise ValueError(f"Cannot create memory with empty content. Original messages: {messages}")
+
+        if precomputed_embedding is not None:
+            embedding = precomputed_embedding
+        else:
+            # Select embedding service based on metadata (for sub-store routing)
+            embedding_service = self._get_embedding_service(metadata)
+
+            # Generate embedding
+            embedding = embedding_service.embed(content, memory_action="add")
+
+        # Final validation before storage
+        if not content or not content.strip():
+            raise ValueError(f"Refusing to store empty content. Original messages: {messages}")
+
+        # Use self.agent_id as fallback if agent_id is not provided
+        agent_id = agent_id or self.agent_id
+
+        memory_data = self._prepare_memory_data(
+            content, embedding, user_id, agent_id, run_id,
+            metadata, filters, scope, memory_type,
+        )
+
         memory_id = self.storage.add_memory(memory_data)
         
         # Log audit event
@@ -2188,6 +2370,143 @@ class Memory(MemoryBase):
             logger.error(f"Failed to get all memories: {e}")
             raise
 
+    @staticmethod
+    def _normalize_row(memory: Dict[str, Any]) -> Dict[str, Any]:
+        """Add canonical keys to a get_all row, in place.
+
+        Aggregation loops downstream (stats, quality analysis) otherwise
+        re-run two- and three-deep dict.get fallback chains per field per
+        row; normalizing once at the paging boundary lets them do a single
+        lookup per field. Original keys are kept for compatibility.
+        """
+        if "content" not in memory:
+            memory["content"] = memory.get("memory") or memory.get("data") or ""
+        if "id" not in memory:
+            memory["id"] = memory.get("memory_id")
+        if "type" not in memory:
+            metadata = memory.get("metadata")
+            memory["type"] = (
+                memory.get("category")
+                or (metadata.get("category") if isinstance(metadata, dict) else None)
+                or "unknown"
+            )
+        return memory
+
+    def iter_all(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        page_size: int = 500,
+        filters: Optional[Dict[str, Any]] = None,
+    ):
+        """Iterate memories newest-first in pages, stopping early at a time cutoff.
+
+        Unlike get_all with a large limit, this fetches page_size rows per
+        backend call and, when created_after is given, stops paging as soon
+        as a row older than the cutoff appears (results are ordered by
+        created_at descending, so everything after it is older too). Peak
+        memory stays O(page_size) and rows that would be discarded by the
+        caller's time filter are never transferred.
+
+        Args:
+            user_id: Optional user ID filter
+            agent_id: Optional agent ID filter
+            run_id: Optional run ID filter
+            created_after: Only yield memories created at or after this time.
+                Rows whose created_at cannot be parsed are skipped; rows
+                that pass the filter carry the parsed UTC datetime under
+                "_parsed_created_at" so downstream consumers (e.g. stats)
+                do not have to parse created_at a second time.
+            page_size: Number of rows fetched per backend call (default: 500)
+            filters: Optional additional filters dictionary
+
+        Yields:
+            List[Dict[str, Any]]: Pages of memory dictionaries in the same
+            shape as get_all()["results"]
+        """
+        if created_after is not None and created_after.tzinfo is None:
+            created_after = created_after.replace(tzinfo=timezone.utc)
+
+        offset = 0
+        while True:
+            page = self.get_all(
+                user_id=user_id,
+                agent_id=agent_id,
+                run_id=run_id,
+                limit=page_size,
+                offset=offset,
+                filters=filters,
+                sort_by="created_at",
+                order="desc",
+            ).get("results", [])
+
+            if not page:
+                return
+
+            if created_after is not None:
+                kept = []
+                for memory in page:
+                    parsed = parse_created_at(memory.get("created_at"))
+                    if parsed is None:
+                        continue
+                    if parsed.tzinfo is None:
+                        parsed = parsed.replace(tzinfo=timezone.utc)
+                    else:
+                        parsed = parsed.astimezone(timezone.utc)
+                    if parsed < created_after:
+                        # Descending order: every remaining row is older
+                        if kept:
+                            yield kept
+                        return
+                    memory["_parsed_created_at"] = parsed
+                    kept.append(self._normalize_row(memory))
+                if kept:
+                    yield kept
+            else:
+                for memory in page:
+                    self._normalize_row(memory)
+                yield page
+
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def quality_counts(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, int]]:
+        """Get memory quality-issue counts aggregated by the storage backend.
+
+        Backends that support it compute the counts in SQL and return only
+        a handful of integers instead of shipping every row to Python.
+
+        Args:
+            user_id: Optional user ID filter
+            agent_id: Optional agent ID filter
+            run_id: Optional run ID filter
+            filters: Optional additional filters dictionary
+
+        Returns:
+            Dict with total, missing_metadata, empty_content,
+            low_importance and low_quality counts, or None when the
+            backend cannot aggregate (callers should fall back to
+            row-level analysis)
+        """
+        try:
+            if getattr(self, "_http_client", None):
+                return None
+            return self.storage.quality_counts(
+                user_id, agent_id, run_id, filters=filters
+            )
+        except Exception as e:
+            logger.error(f"Failed to get quality counts: {e}")
+            return None
+
     def count_all(
         self,
         user_id: Optional[str] = None,
@@ -2639,24 +2958,26 @@ class Memory(MemoryBase):
         agent_id: Optional[str] = None,
         run_id: Optional[str] = None,
         limit: int = 1000,
+        pretty: bool = False,
     ) -> str:
         """Export memories to JSON or CSV format.
-        
+
         Args:
             format: Export format ("json" or "csv")
             user_id: Filter by user ID
             agent_id: Filter by agent ID
             run_id: Filter by run ID
             limit: Maximum number of memories to export
-            
+            pretty: Indent JSON output (cosmetic; slower and larger)
+
         Returns:
             str: Exported content string
         """
         result = self.get_all(user_id=user_id, agent_id=agent_id, run_id=run_id, limit=limit)
         memories = result.get("results", [])
-        
+
         if format.lower() == "json":
-            return export_to_json(memories)
+            return export_to_json(memories, pretty=pretty)
         elif format.lower() == "csv":
             return export_to_csv(memories)
         else:
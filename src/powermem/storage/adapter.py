@@ -90,10 +90,8 @@ class StorageAdapter:
                     db_filters[self._metadata_filter_key_for_store(key)] = value
         return db_filters
 
-    def add_memory(self, memory_data: Dict[str, Any]) -> int:
-        """Add a memory to the store."""
-        # ID will be generated using Snowflake algorithm before insertion
-        
+    def _prepare_insert(self, memory_data: Dict[str, Any]):
+        """Resolve the target store and build (vector, payload) for one memory."""
         # Create vector from content using embedding service
         content = memory_data.get("content", "")
         metadata = memory_data.get("metadata", {})
@@ -155,14 +153,59 @@ class StorageAdapter:
         for key, value in memory_data.items():
             if key not in excluded_fields:
                 payload[key] = serialize_datetime(value)
-        
+
+        return target_store, vector, payload
+
+    def add_memory(self, memory_data: Dict[str, Any]) -> int:
+        """Add a memory to the store."""
+        # ID will be generated using Snowflake algorithm before insertion
+        target_store, vector, payload = self._prepare_insert(memory_data)
+
         # Insert and get generated Snowflake ID
         generated_ids = target_store.insert([vector], [payload])
         if not generated_ids:
             raise ValueError("Failed to insert memory: no ID returned from vector store")
         memory_id = generated_ids[0]  # Get the first (and only) generated Snowflake ID
         return memory_id
-    
+
+    def add_memories(self, memory_data_list: List[Dict[str, Any]]) -> List[int]:
+        """Add multiple memories with bulk vector-store inserts.
+
+        Rows are grouped by target store (sub-store routing may split the
+        batch) and inserted in chunks of up to 1000, so N memories cost
+        one insert round-trip per store per chunk instead of N.
+
+        Returns:
+            Generated memory IDs, in input order.
+        """
+        batch_size = 1000
+        ids: List[Optional[int]] = [None] * len(memory_data_list)
+
+        groups: Dict[int, tuple] = {}
+        for idx, memory_data in enumerate(memory_data_list):
+            target_store, vector, payload = self._prepare_insert(memory_data)
+            groups.setdefault(id(target_store), (target_store, []))[1].append(
+                (idx, vector, payload)
+            )
+
+        for target_store, entries in groups.values():
+            for start in range(0, len(entries), batch_size):
+                chunk = entries[start:start + batch_size]
+                generated_ids = target_store.insert(
+                    [vector for _, vector, _ in chunk],
+                    [payload for _, _, payload in chunk],
+                )
+                if not generated_ids or len(generated_ids) != len(chunk):
+                    raise ValueError(
+                        "Failed to bulk insert memories: vector store returned "
+                        f"{len(generated_ids or [])} IDs for {len(chunk)} rows"
+                    )
+                for (idx, _, _), memory_id in zip(chunk, generated_ids):
+                    ids[idx] = memory_id
+
+        return ids
+
+
     def search_memories(
         self,
         query_embedding: List[float],
@@ -598,6 +641,29 @@ class StorageAdapter:
 
         return memories
 
+    def quality_counts(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, int]]:
+        """Get quality-issue counts computed by the backend, if supported.
+
+        Returns None when the underlying vector store has no
+        quality_counts capability (callers fall back to row-level
+        analysis in that case).
+        """
+        if not hasattr(self.vector_store, "quality_counts"):
+            return None
+
+        db_filters = self._build_db_filters(user_id, agent_id, run_id, filters)
+        try:
+            return self.vector_store.quality_counts(filters=db_filters or None)
+        except Exception as e:
+            logger.error(f"Failed to get quality counts with filters {db_filters}: {e}", exc_info=True)
+            return None
+
     def count_all_memories(
         self,
         user_id: Optional[str] = None,
@@ -584,6 +584,80 @@ class SQLiteVectorStore(VectorStoreBase):
 
         return count
 
+    def quality_counts(self, filters=None) -> Dict[str, int]:
+        """Count quality issues in SQL, returning aggregates instead of rows.
+
+        Computes the same criteria as the server's quality analysis
+        (missing/empty metadata, content shorter than 5 characters after
+        trimming, importance below 0.3) in a single query, so only five
+        integers cross the storage boundary.
+
+        Args:
+            filters: Optional filters dictionary
+
+        Returns:
+            Dict with total, missing_metadata, empty_content,
+            low_importance and low_quality (distinct rows with any issue)
+        """
+        # First non-null importance candidate, mirroring _extract_importance;
+        # only JSON numbers are considered (string-encoded numbers are rare
+        # and fall through to "no importance recorded")
+        importance_expr = (
+            "COALESCE("
+            "json_extract(payload, '$.metadata.intelligence.importance_score'), "
+            "json_extract(payload, '$.metadata.importance'), "
+            "json_extract(payload, '$.metadata.importance_score'), "
+            "json_extract(payload, '$.importance'), "
+            "json_extract(payload, '$.importance_score'))"
+        )
+        query = f"""
+            WITH q AS (
+                SELECT
+                    CASE WHEN json_extract(payload, '$.metadata') IS NULL
+                              OR json_extract(payload, '$.metadata') IN ('{{}}', 'null')
+                         THEN 1 ELSE 0 END AS missing_metadata,
+                    CASE WHEN LENGTH(TRIM(COALESCE(json_extract(payload, '$.data'), ''))) < 5
+                         THEN 1 ELSE 0 END AS empty_content,
+                    CASE WHEN typeof({importance_expr}) IN ('integer', 'real')
+                              AND CAST({importance_expr} AS REAL) < 0.3
+                         THEN 1 ELSE 0 END AS low_importance
+                FROM {self.collection_name}
+        """
+        query_params = []
+
+        if filters:
+            conditions = []
+            for key, value in filters.items():
+                # Filter by JSON field in payload
+                conditions.append("(json_extract(payload, ?) = ?)")
+                query_params.extend([_json_path_for_key(key), value])
+
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+
+        query += """
+            )
+            SELECT COUNT(*),
+                   SUM(missing_metadata),
+                   SUM(empty_content),
+                   SUM(low_importance),
+                   SUM(CASE WHEN missing_metadata + empty_content + low_importance > 0
+                            THEN 1 ELSE 0 END)
+            FROM q
+        """
+
+        with self._lock:
+            cursor = self.connection.execute(query, query_params)
+            row = cursor.fetchone()
+
+        return {
+            "total": row[0] or 0,
+            "missing_metadata": row[1] or 0,
+            "empty_content": row[2] or 0,
+            "low_importance": row[3] or 0,
+            "low_quality": row[4] or 0,
+        }
+
     def reset(self) -> None:
         """Reset by deleting and recreating the collection."""
         self.delete_col()
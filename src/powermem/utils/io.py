@@ -3,61 +3,161 @@ Memory Import/Export utilities
 
 This module provides functions for exporting memories to JSON/CSV
 and importing memories from JSON/CSV files.
+
+orjson is used for JSON encoding/decoding when available (it handles
+datetime natively and is significantly faster on large payloads),
+falling back to the stdlib json module otherwise.
 """
 
 import json
 import csv
 import io as io_module
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def export_to_json(memories: List[Dict[str, Any]]) -> str:
-    """Export memories to JSON format."""
-    def default_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-    return json.dumps(memories, indent=2, default=default_serializer)
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
-def export_to_csv(memories: List[Dict[str, Any]]) -> str:
-    """Export memories to CSV format."""
+if msgspec is not None:
+    class _MemoryRec(msgspec.Struct):
+        """Typed import schema; decoding into it applies field defaults in C."""
+
+        id: Any = None
+        content: str = ""
+        role: str = "user"
+        metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+        created_at: Any = None
+        updated_at: Any = None
+
+    _JSON_DECODER = msgspec.json.Decoder(List[_MemoryRec])
+else:
+    _JSON_DECODER = None
+
+
+def _default_serializer(obj):
+    """Stdlib json fallback serializer for datetime objects."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize a small object (e.g. metadata) to compact JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, default=_default_serializer)
+
+
+def _to_str(value: Any) -> str:
+    """Coerce to str, skipping the conversion for the hot already-str case."""
+    return value if isinstance(value, str) else str(value)
+
+
+def _loads(data: Any) -> Any:
+    """Deserialize JSON from a string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def export_to_json(memories: List[Dict[str, Any]], pretty: bool = False) -> str:
+    """Export memories to JSON format.
+
+    Compact output by default: indentation is cosmetic for programmatic
+    export and inflates both encode time and payload size. Pass
+    pretty=True for human-readable output.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NAIVE_UTC
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(memories, option=option).decode()
+    return json.dumps(
+        memories, indent=2 if pretty else None, default=_default_serializer
+    )
+
+
+# Hoisted CSV constants: field names never change, and no field needs
+# quoting, so the header bytes can be emitted as-is
+_CSV_FIELDS = ('id', 'content', 'role', 'metadata', 'created_at', 'updated_at')
+_CSV_HEADER = (','.join(_CSV_FIELDS) + '\r\n').encode('utf-8')
+
+
+class _RowBuffer:
+    """Minimal write() target that keeps only the last row csv emitted."""
+
+    def __init__(self):
+        self.last = ""
+
+    def write(self, s: str):
+        self.last = s
+
+
+def iter_csv(memories: List[Dict[str, Any]]):
+    """Yield memories as UTF-8 encoded CSV rows (header first).
+
+    Suitable for streaming responses: peak memory stays O(1 row) instead
+    of materializing the whole export in memory.
+    """
     if not memories:
-        return ""
-    output = io_module.StringIO()
-    fieldnames = ['id', 'content', 'role', 'metadata', 'created_at', 'updated_at']
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
+        return
+    buf = _RowBuffer()
+    # QUOTE_MINIMAL keeps quoting work to fields that actually need it.
+    # The lineterminator stays at the default \r\n: QUOTE_MINIMAL keys
+    # quoting off the terminator's characters, so a bare \n would leave
+    # fields containing \r unquoted and break the import round-trip
+    writer = csv.writer(buf, dialect='excel', quoting=csv.QUOTE_MINIMAL)
+    yield _CSV_HEADER
+    _get = dict.get  # hoisted attribute lookup for the row loop
     for memory in memories:
-        row = {
-            'id': memory.get('id', ''),
-            'content': memory.get('content', ''),
-            'role': memory.get('role', 'user'),
-            'metadata': json.dumps(memory.get('metadata', {})),
-            'created_at': str(memory.get('created_at', '')),
-            'updated_at': str(memory.get('updated_at', ''))
-        }
-        writer.writerow(row)
-    return output.getvalue()
+        writer.writerow((
+            _get(memory, 'id', ''),
+            _get(memory, 'content', ''),
+            _get(memory, 'role', 'user'),
+            _dumps_compact(_get(memory, 'metadata') or {}),
+            _to_str(_get(memory, 'created_at', '')),
+            _to_str(_get(memory, 'updated_at', '')),
+        ))
+        yield buf.last.encode('utf-8')
 
 
-def import_from_json(json_str: str) -> List[Dict[str, Any]]:
-    """Import memories from JSON format."""
-    memories = json.loads(json_str)
-    result = []
-    for memory in memories:
-        if isinstance(memory, dict):
-            cleaned = {
-                'id': memory.get('id'),
-                'content': memory.get('content', ''),
-                'role': memory.get('role', 'user'),
-                'metadata': memory.get('metadata', {}),
-                'created_at': memory.get('created_at'),
-                'updated_at': memory.get('updated_at')
-            }
-            result.append(cleaned)
-    return result
+def export_to_csv(memories: List[Dict[str, Any]]) -> str:
+    """Export memories to CSV format."""
+    return b"".join(iter_csv(memories)).decode()
+
+
+def import_from_json(json_str: Union[str, bytes]) -> List[Dict[str, Any]]:
+    """Import memories from JSON format (accepts str or bytes)."""
+    if _JSON_DECODER is not None:
+        try:
+            records = _JSON_DECODER.decode(
+                json_str.encode() if isinstance(json_str, str) else json_str
+            )
+            return [msgspec.structs.asdict(r) for r in records]
+        except msgspec.DecodeError:
+            # Fall back to the lenient dict-based path (e.g. non-dict items)
+            pass
+    memories = _loads(json_str)
+    return [
+        {
+            'id': m.get('id'),
+            'content': m.get('content', ''),
+            'role': m.get('role', 'user'),
+            'metadata': m.get('metadata', {}),
+            'created_at': m.get('created_at'),
+            'updated_at': m.get('updated_at')
+        }
+        for m in memories
+        if isinstance(m, dict)
+    ]
 
 
 def import_from_csv(csv_str: str) -> List[Dict[str, Any]]:
@@ -68,11 +168,13 @@ def import_from_csv(csv_str: str) -> List[Dict[str, Any]]:
     reader = csv.DictReader(input_stream)
     memories = []
     for row in reader:
+        # Skip the parser entirely for the dominant empty-metadata case
+        md = row.get('metadata')
         memory = {
             'id': row.get('id'),
             'content': row.get('content', ''),
             'role': row.get('role', 'user'),
-            'metadata': json.loads(row.get('metadata', '{}')),
+            'metadata': _loads(md) if md and md != '{}' else {},
             'created_at': row.get('created_at'),
             'updated_at': row.get('updated_at')
         }
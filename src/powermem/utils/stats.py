@@ -6,11 +6,17 @@ stats are computed with the same logic and data path (get_all + this module).
 """
 
 from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from powermem.utils.utils import parse_created_at
 
+# Row counts below this use the plain-Python aggregation path; array
+# construction overhead outweighs the vectorized reductions on small batches
+_VECTORIZE_MIN_ROWS = 1000
+
 
 def _parse_datetime_for_stats(date_str: Optional[str]) -> Optional[datetime]:
     """Parse created_at for stats; return UTC-aware datetime or None."""
@@ -80,22 +86,26 @@ def calculate_stats_from_memories(memories: List[Dict[str, Any]]) -> Dict[str, A
     total_importance = 0.0
     importance_count = 0
     access_counts = []
-    growth_by_date = defaultdict(int)
-    age_distribution = {
-        "< 1 day": 0,
-        "1-7 days": 0,
-        "7-30 days": 0,
-        "> 30 days": 0,
-    }
+    date_objs = []
     now_utc = datetime.now(timezone.utc)
+    # Precomputed bucket thresholds: one datetime comparison per row
+    # instead of constructing a timedelta per row
+    day_cutoff = now_utc - timedelta(days=1)
+    week_cutoff = now_utc - timedelta(days=7)
+    month_cutoff = now_utc - timedelta(days=30)
 
     for m in memories:
         metadata = m.get("metadata") if isinstance(m.get("metadata"), dict) else {}
-        mem_type = (
-            m.get("category")
-            or metadata.get("category")
-            or "unknown"
-        )
+        # Rows normalized at the paging boundary (Memory._normalize_row)
+        # carry canonical "type"/"content"/"id" keys; the fallback chains
+        # below only run for raw rows from other producers
+        mem_type = m.get("type")
+        if mem_type is None:
+            mem_type = (
+                m.get("category")
+                or metadata.get("category")
+                or "unknown"
+            )
         by_type[mem_type] += 1
 
         importance = _extract_importance(m)
@@ -108,30 +118,100 @@ def calculate_stats_from_memories(memories: List[Dict[str, Any]]) -> Dict[str, A
             access_count = int(raw_access_count)
         except (TypeError, ValueError):
             access_count = 0
+        memory_id = m.get("id")
+        if memory_id is None:
+            memory_id = m.get("memory_id")
+        content = m.get("content")
+        if content is None:
+            content = m.get("memory") or ""
         access_counts.append({
-            "id": m.get("id") or m.get("memory_id"),
-            "content": (m.get("memory") or m.get("content") or "")[:100],
+            "id": memory_id,
+            "content": content[:100],
             "access_count": access_count,
         })
 
-        created_at = m.get("created_at")
-        if created_at:
-            date_obj = _parse_datetime_for_stats(created_at)
-            if date_obj is not None:
-                date_key = date_obj.strftime("%Y-%m-%d")
-                growth_by_date[date_key] += 1
-                age = (now_utc - date_obj).days
-                if age < 1:
-                    age_distribution["< 1 day"] += 1
-                elif age < 7:
-                    age_distribution["1-7 days"] += 1
-                elif age < 30:
-                    age_distribution["7-30 days"] += 1
-                else:
-                    age_distribution["> 30 days"] += 1
-
-    access_counts.sort(key=lambda x: x["access_count"], reverse=True)
-    top_accessed = access_counts[:10]
+        # Rows that went through a time filter (Memory.iter_all) carry the
+        # already-parsed datetime; only parse created_at when they don't
+        date_obj = m.get("_parsed_created_at")
+        if date_obj is None:
+            created_at = m.get("created_at")
+            if created_at:
+                date_obj = _parse_datetime_for_stats(created_at)
+        if date_obj is not None:
+            date_objs.append(date_obj)
+
+    if len(date_objs) >= _VECTORIZE_MIN_ROWS:
+        # Columnar aggregation: one searchsorted/bincount pass for the age
+        # buckets and one unique pass for growth, instead of per-row
+        # branching in Python
+        n = len(date_objs)
+        timestamps = np.fromiter(
+            (d.timestamp() for d in date_objs), dtype=np.float64, count=n
+        )
+        # Ascending edges; side="left" preserves the strict > comparison of
+        # the scalar path (a row exactly on a cutoff falls in the older bucket)
+        edges = np.array([
+            month_cutoff.timestamp(),
+            week_cutoff.timestamp(),
+            day_cutoff.timestamp(),
+        ])
+        buckets = np.bincount(
+            np.searchsorted(edges, timestamps, side="left"), minlength=4
+        )
+        age_distribution = {
+            "< 1 day": int(buckets[3]),
+            "1-7 days": int(buckets[2]),
+            "7-30 days": int(buckets[1]),
+            "> 30 days": int(buckets[0]),
+        }
+
+        ordinals = np.fromiter(
+            (d.toordinal() for d in date_objs), dtype=np.int64, count=n
+        )
+        days, day_counts = np.unique(ordinals, return_counts=True)
+        growth_by_date = {
+            date.fromordinal(int(o)).isoformat(): int(c)
+            for o, c in zip(days, day_counts)
+        }
+    else:
+        age_distribution = {
+            "< 1 day": 0,
+            "1-7 days": 0,
+            "7-30 days": 0,
+            "> 30 days": 0,
+        }
+        # Keyed by day ordinal (int hash, no string alloc per row);
+        # formatted to YYYY-MM-DD once per unique day after the loop
+        growth_by_ordinal = defaultdict(int)
+        for date_obj in date_objs:
+            growth_by_ordinal[date_obj.toordinal()] += 1
+            if date_obj > day_cutoff:
+                age_distribution["< 1 day"] += 1
+            elif date_obj > week_cutoff:
+                age_distribution["1-7 days"] += 1
+            elif date_obj > month_cutoff:
+                age_distribution["7-30 days"] += 1
+            else:
+                age_distribution["> 30 days"] += 1
+        growth_by_date = {
+            date.fromordinal(o).isoformat(): c
+            for o, c in growth_by_ordinal.items()
+        }
+
+    if len(access_counts) > 10 and len(access_counts) >= _VECTORIZE_MIN_ROWS:
+        # argpartition is O(n) vs O(n log n) for a full sort when only the
+        # top 10 are reported
+        counts_arr = np.fromiter(
+            (a["access_count"] for a in access_counts),
+            dtype=np.int64,
+            count=len(access_counts),
+        )
+        top_idx = np.argpartition(counts_arr, -10)[-10:]
+        top_idx = top_idx[np.argsort(counts_arr[top_idx])[::-1]]
+        top_accessed = [access_counts[i] for i in top_idx]
+    else:
+        access_counts.sort(key=lambda x: x["access_count"], reverse=True)
+        top_accessed = access_counts[:10]
 
     return {
         "total_memories": total_memories,
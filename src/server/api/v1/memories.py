@@ -372,6 +372,7 @@ async def export_memories(
     agent_id: Optional[str] = Query(None, description="Filter by agent ID"),
     run_id: Optional[str] = Query(None, description="Filter by run ID"),
     limit: int = Query(1000, ge=1, le=10000, description="Max memories to export"),
+    pretty: bool = Query(False, description="Indent JSON output (slower, larger)"),
     api_key: str = Depends(verify_api_key),
     service: MemoryService = Depends(get_memory_service),
 ):
@@ -382,6 +383,7 @@ async def export_memories(
         agent_id=agent_id,
         run_id=run_id,
         limit=limit,
+        pretty=pretty,
     )
 
     media_type = "application/json" if format.lower() == "json" else "text/csv"
@@ -2,41 +2,121 @@
 System management API routes
 """
 
+import asyncio
+import time
+from functools import lru_cache
+
+import orjson
+
 from fastapi import APIRouter, Depends, Request, Response, Query
 from slowapi import Limiter
 from typing import Optional
-from datetime import datetime, timezone
 
-from ...models.response import APIResponse, HealthResponse, StatusResponse
+from ...models.response import APIResponse, StatusResponse
 from ...middleware.auth import verify_api_key
 from ...middleware.rate_limit import limiter, get_rate_limit_string
 from ...config import config
 from ...utils.metrics import get_metrics_collector
-from ...utils.health_check import check_all_dependencies
+from ...utils.health_check import aggregate_status, check_all_dependencies
+from ...utils.orjson_response import ORJSONResponse
+from ...utils.msgpack_response import MsgpackResponse, wants_msgpack
 from powermem import auto_config
 from powermem.version import __version__ as powermem_version
 
 # Import server start time from state module to avoid circular imports
-from ...state import SERVER_START_TIME
+from ...state import SERVER_START_TIME, SERVER_START_MONO
+
+router = APIRouter(
+    prefix="/system", tags=["system"], default_response_class=ORJSONResponse
+)
+
+# Short-TTL cache for rendered Prometheus metrics so bursts of scrapes
+# (multiple Prometheus instances, dashboards) collapse into one render
+_METRICS_TTL = 0.5  # seconds
+_metrics_cache = {"t": 0.0, "body": b""}
+_metrics_lock = asyncio.Lock()
+
+
+# The health payload is constant, and load balancers hit this endpoint at
+# high frequency; freeze the encoded bytes once so each probe skips model
+# construction, validation and JSON encoding entirely
+_HEALTH_BODY = orjson.dumps({
+    "success": True,
+    "data": {"status": "healthy"},
+    "message": "Service is healthy",
+})
+
+
+@lru_cache(maxsize=1)
+def _cached_auto_config():
+    """Config is static per process; parse it once instead of per request."""
+    return auto_config()
+
 
-router = APIRouter(prefix="/system", tags=["system"])
+# Lazily resolved (storage_type, llm_provider) pair; neither changes at
+# runtime, so the isinstance/hasattr probing runs once per process
+_PROVIDER_INFO = None
+
+
+def _resolve_provider_info():
+    """Derive (storage_type, llm_provider) from config, once."""
+    global _PROVIDER_INFO
+    if _PROVIDER_INFO is None:
+        powermem_config = _cached_auto_config()
+
+        storage_type = None
+        llm_provider = None
+
+        if isinstance(powermem_config, dict):
+            # Extract from dict config
+            vector_store = powermem_config.get("vector_store") or powermem_config.get("database", {})
+            storage_type = vector_store.get("provider") if isinstance(vector_store, dict) else None
+
+            llm = powermem_config.get("llm", {})
+            llm_provider = llm.get("provider") if isinstance(llm, dict) else None
+        else:
+            # Extract from config object
+            if hasattr(powermem_config, "vector_store") and powermem_config.vector_store:
+                storage_type = powermem_config.vector_store.provider
+            if hasattr(powermem_config, "llm") and powermem_config.llm:
+                llm_provider = powermem_config.llm.provider
+
+        _PROVIDER_INFO = (storage_type, llm_provider)
+    return _PROVIDER_INFO
+
+
+# Short-TTL cache for dependency health so bursty status polls collapse
+# into a single round of probes
+_DEP_TTL = 2.0  # seconds
+_dep_cache = {"t": 0.0, "val": None}
+_dep_lock = asyncio.Lock()
+
+
+async def _cached_check_all_dependencies():
+    """Run check_all_dependencies with a short TTL cache."""
+    now = time.monotonic()
+    if _dep_cache["val"] is not None and now - _dep_cache["t"] < _DEP_TTL:
+        return _dep_cache["val"]
+    async with _dep_lock:
+        # Double-check after acquiring the lock so only one coroutine probes
+        now = time.monotonic()
+        if _dep_cache["val"] is not None and now - _dep_cache["t"] < _DEP_TTL:
+            return _dep_cache["val"]
+        dependencies = await check_all_dependencies()
+        _dep_cache["val"] = dependencies
+        _dep_cache["t"] = time.monotonic()
+        return dependencies
 
 
 @router.get(
     "/health",
-    response_model=APIResponse,
+    responses={200: {"model": APIResponse}},
     summary="Health check",
     description="Check if the API server is healthy (public endpoint, no authentication required)",
 )
 async def health_check():
     """Health check endpoint"""
-    health = HealthResponse(status="healthy")
-    
-    return APIResponse(
-        success=True,
-        data=health.model_dump(mode='json'),
-        message="Service is healthy",
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get(
@@ -52,48 +132,21 @@ async def get_status(
 ):
     """Get system status"""
     try:
-        # Get PowerMem config
-        powermem_config = auto_config()
-        
-        storage_type = None
-        llm_provider = None
-        
-        if isinstance(powermem_config, dict):
-            # Extract from dict config
-            vector_store = powermem_config.get("vector_store") or powermem_config.get("database", {})
-            storage_type = vector_store.get("provider") if isinstance(vector_store, dict) else None
-            
-            llm = powermem_config.get("llm", {})
-            llm_provider = llm.get("provider") if isinstance(llm, dict) else None
-        else:
-            # Extract from config object
-            if hasattr(powermem_config, "vector_store") and powermem_config.vector_store:
-                storage_type = powermem_config.vector_store.provider
-            if hasattr(powermem_config, "llm") and powermem_config.llm:
-                llm_provider = powermem_config.llm.provider
-        
+        storage_type, llm_provider = _resolve_provider_info()
+
         # Calculate uptime
-        now = datetime.now(timezone.utc)
-        uptime_seconds = (now - SERVER_START_TIME).total_seconds()
-        
+        uptime_seconds = time.monotonic() - SERVER_START_MONO
+
         # Check dependencies
-        dependencies = await check_all_dependencies()
-        
-        # Determine overall system status based on dependencies
-        system_status = "operational"
-        degraded_count = sum(1 for dep in dependencies.values() if dep.status == "degraded")
-        unavailable_count = sum(1 for dep in dependencies.values() if dep.status == "unavailable")
+        dependencies = await _cached_check_all_dependencies()
         
-        if unavailable_count > 0:
-            system_status = "down"
-        elif degraded_count > 0:
-            system_status = "degraded"
-        
-        # Convert dependencies to dict for response
-        dependencies_dict = {
-            name: dep.model_dump(mode='json')
-            for name, dep in dependencies.items()
-        }
+        # Shared probe semantics: critical-dependency failures mean down,
+        # anything else failing means degraded
+        system_status = {
+            "healthy": "operational",
+            "degraded": "degraded",
+            "unavailable": "down",
+        }[aggregate_status(dependencies)]
         
         status_data = StatusResponse(
             status=system_status,
@@ -102,18 +155,25 @@ async def get_status(
             llm_provider=llm_provider,
             uptime_seconds=uptime_seconds,
             started_at=SERVER_START_TIME,
-            dependencies=dependencies_dict,
+            dependencies=dependencies,
         )
-        
+
+        # msgpack content negotiation for monitoring scrapers
+        if wants_msgpack(request.headers.get("accept", "")):
+            return MsgpackResponse({
+                "success": True,
+                "data": status_data.model_dump(mode='python'),
+                "message": "System status retrieved successfully",
+            })
+
         return APIResponse(
             success=True,
-            data=status_data.model_dump(mode='json'),
+            data=status_data,
             message="System status retrieved successfully",
         )
     except Exception as e:
         # Fallback: return basic status even if dependencies check fails
-        now = datetime.now(timezone.utc)
-        uptime_seconds = (now - SERVER_START_TIME).total_seconds()
+        uptime_seconds = time.monotonic() - SERVER_START_MONO
         
         status_data = StatusResponse(
             status="degraded",
@@ -127,7 +187,7 @@ async def get_status(
         
         return APIResponse(
             success=True,
-            data=status_data.model_dump(mode='json'),
+            data=status_data,
             message=f"System status retrieved with errors: {str(e)[:100]}",
         )
 
@@ -143,18 +203,24 @@ async def get_metrics(
     api_key: str = Depends(verify_api_key),
 ):
     """Get Prometheus format metrics"""
-    metrics_collector = get_metrics_collector()
-    metrics_text = metrics_collector.get_metrics()
-    
+    now = time.monotonic()
+    if now - _metrics_cache["t"] > _METRICS_TTL:
+        async with _metrics_lock:
+            # Double-check after acquiring the lock so only one coroutine renders
+            if now - _metrics_cache["t"] > _METRICS_TTL:
+                metrics_collector = get_metrics_collector()
+                _metrics_cache["body"] = metrics_collector.get_metrics().encode("utf-8")
+                _metrics_cache["t"] = time.monotonic()
+
     return Response(
-        content=metrics_text,
+        content=_metrics_cache["body"],
         media_type="text/plain; version=0.0.4; charset=utf-8"
     )
 
 
 @router.delete(
     "/delete-all-memories",
-    response_model=APIResponse,
+    responses={200: {"model": APIResponse}},
     summary="Delete all memories",
     description="Delete all memories matching the provided filters (requires admin permissions). "
                 "This endpoint uses Memory.delete_all() to match the powermem SDK API. "
@@ -170,21 +236,24 @@ async def delete_all_memories(
 ):
     """
     Delete all memories matching the provided filters.
-    
+
     This endpoint uses Memory.delete_all() to match the powermem SDK API.
     If no filters are provided, all memories will be deleted.
     """
-    from powermem import Memory
     from ...models.errors import ErrorCode, APIError
-    
+    # Route through the shared service singleton so its read caches are
+    # invalidated; a standalone Memory instance would leave cached
+    # listings serving the deleted rows until the TTL expired
+    from .memories import get_memory_service
+
     try:
-        memory = Memory(config=auto_config())
-        result = memory.delete_all(
+        service = get_memory_service(request)
+        result = service.delete_all_memories(
             user_id=user_id,
             agent_id=agent_id,
             run_id=run_id,
         )
-        
+
         filters = {}
         if user_id:
             filters["user_id"] = user_id
@@ -194,12 +263,16 @@ async def delete_all_memories(
             filters["run_id"] = run_id
         
         filter_desc = f" with filters: {filters}" if filters else ""
-        
-        return APIResponse(
-            success=True,
-            data={"deleted": result, "filters": filters},
-            message=f"All memories{filter_desc} deleted successfully",
-        )
+
+        # Return a plain dict through ORJSONResponse: same bytes on the wire,
+        # minus the APIResponse validate + dump round-trip
+        return ORJSONResponse({
+            "success": True,
+            "data": {"deleted": result, "filters": filters},
+            "message": f"All memories{filter_desc} deleted successfully",
+        })
+    except APIError:
+        raise
     except Exception as e:
         raise APIError(
             code=ErrorCode.INTERNAL_ERROR,
@@ -57,6 +57,9 @@ class ServerSettings(BaseSettings):
     rate_limit_enabled: bool = Field(default=True)
     rate_limit_per_minute: int = Field(default=100)
 
+    # Worker pool size for bulk memory operations (I/O-bound fan-out)
+    bulk_worker_pool_size: int = Field(default=16)
+
     # Logging settings
     log_level: str = Field(default="INFO")
     # Default follows .env.example.full (LOG_FORMAT=json): machine-parseable,
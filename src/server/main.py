@@ -14,6 +14,7 @@ from slowapi import _rate_limit_exceeded_handler
 
 from .config import config
 from .dashboard_assets import DASHBOARD_DIR, dashboard_assets_available
+from .utils.orjson_response import ORJSONResponse
 from .api.v1 import router as v1_router
 from .middleware.logging import setup_logging, LoggingMiddleware
 from .middleware.rate_limit import rate_limit_middleware
@@ -55,6 +56,12 @@ async def _service_lifespan(app: FastAPI):
     from .services.user_service import UserService
     from .services.agent_service import AgentService
 
+    from .utils.health_check import shutdown_http, start_status_refresher
+
+    # Keep the dependency-status snapshot warm so fast=True readers
+    # (dashboards, metrics exporters) never trigger a probe themselves
+    status_refresher = start_status_refresher()
+
     logger.info("Initializing service singletons...")
     try:
         app.state.memory_service = MemoryService()
@@ -73,6 +80,9 @@ async def _service_lifespan(app: FastAPI):
 
     logger.info("Shutting down services...")
 
+    status_refresher.cancel()
+    await shutdown_http()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -94,6 +104,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -202,7 +202,7 @@ class StatusResponse(BaseModel):
     llm_provider: Optional[str] = Field(None, description="LLM provider")
     uptime_seconds: Optional[float] = Field(None, description="Service uptime in seconds")
     started_at: Optional[datetime] = Field(None, description="Service start time")
-    dependencies: Optional[Dict[str, Dict[str, Any]]] = Field(None, description="Dependency health status")
+    dependencies: Optional[Dict[str, DependencyStatus]] = Field(None, description="Dependency health status")
     timestamp: datetime = Field(default_factory=get_current_datetime, description="Status timestamp")
     
     @field_serializer('timestamp', 'started_at')
@@ -2,20 +2,42 @@
 Memory service for PowerMem API
 """
 
+import asyncio
+import json
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import deepcopy
 from typing import Any, Dict, List, Optional
 from datetime import datetime
+
+import numpy as np
 from powermem import Memory, auto_config
+from ..config import config as server_config
 from ..models.errors import ErrorCode, APIError
 from ..utils.converters import memory_dict_to_response
 from ..utils.metrics import get_metrics_collector
 
 logger = logging.getLogger("server")
 
+# TTL for cached read-heavy results (statistics, user list, quality
+# analysis, hot listings); dashboards re-poll these with identical
+# arguments far more often than data changes
+_READ_CACHE_TTL = 30.0  # seconds
+_READ_CACHE_MAX_ENTRIES = 512
+
 
 class MemoryService:
     """Service for memory management operations"""
-    
+
+    # The storage adapter contract guarantees get_all returns a list of
+    # dicts; set to False to re-enable per-item validation when debugging
+    # a misbehaving backend
+    _trust_backend_types: bool = True
+
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize memory service.
@@ -27,8 +49,137 @@ class MemoryService:
             config = auto_config()
         
         self.memory = Memory(config=config)
+        self._read_cache: Dict[tuple, tuple] = {}
+        self._read_cache_fifo: deque = deque()
+        self._read_cache_lock = threading.Lock()
+        # Per-scope write epochs; cache keys embed the epoch so a write
+        # invalidates the scope's cached reads lazily, without a sweep
+        self._cache_epochs: Dict[tuple, int] = {}
+        # Resolved once: the collector is a process-wide singleton, no need
+        # to go through the registry lookup on every operation
+        self._metrics = get_metrics_collector()
         logger.info("MemoryService initialized")
-    
+
+    def _read_cache_get(self, key: tuple):
+        """Return a deep-copied cached value for key, or None if stale/missing."""
+        with self._read_cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= _READ_CACHE_TTL:
+                del self._read_cache[key]
+                return None
+            return deepcopy(entry[1])
+
+    def _read_cache_put(self, key: tuple, value) -> None:
+        """Cache value under key (deep-copied so callers can't mutate it)."""
+        with self._read_cache_lock:
+            while len(self._read_cache) >= _READ_CACHE_MAX_ENTRIES and self._read_cache_fifo:
+                # FIFO eviction; the oldest entries are also the most
+                # likely to carry a stale epoch
+                evicted = self._read_cache_fifo.popleft()
+                self._read_cache.pop(evicted, None)
+            if key not in self._read_cache:
+                self._read_cache_fifo.append(key)
+            self._read_cache[key] = (time.time(), deepcopy(value))
+
+    def _cache_epoch(self, user_id: Optional[str], agent_id: Optional[str]) -> int:
+        """Current write epoch for a read scope (0 if never written)."""
+        return self._cache_epochs.get((user_id or "", agent_id or ""), 0)
+
+    def _invalidate_read_cache(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> None:
+        """Bump the write epochs affected by a write in the given scope.
+
+        Cache keys embed their scope's epoch, so bumping it orphans every
+        cached read for that scope in O(1); orphans age out via FIFO
+        eviction or TTL. A scoped write also affects the partially- and
+        fully-unscoped aggregates (user-only, agent-only, and global
+        reads include its data), so all four scope combinations advance.
+        """
+        uid = user_id or ""
+        aid = agent_id or ""
+        with self._read_cache_lock:
+            for scope in {(uid, aid), (uid, ""), ("", aid), ("", "")}:
+                self._cache_epochs[scope] = self._cache_epochs.get(scope, 0) + 1
+
+    def _invalidate_all_read_caches(self) -> None:
+        """Orphan every cached read, regardless of scope.
+
+        Used by cross-scope writes (admin delete-all): a filter like
+        user_id-only can touch any (user, agent) combination, which the
+        per-scope epoch bump cannot cover. Epochs still advance so an
+        in-flight computation cannot re-insert a stale result under an
+        old key after the clear.
+        """
+        with self._read_cache_lock:
+            for scope in self._cache_epochs:
+                self._cache_epochs[scope] += 1
+            self._read_cache.clear()
+            self._read_cache_fifo.clear()
+
+    def _batch_get_memories(
+        self,
+        memory_ids: List[int],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Fetch multiple memories in a single backend call, mapped by id.
+
+        The storage layer has no multi-get, so this issues one
+        recency-sorted get_all (freshly written ids are the most recent
+        rows) and partitions the result in memory, instead of paying one
+        get() round-trip per id.
+
+        Args:
+            memory_ids: Memory IDs to fetch
+            user_id: User ID for access control
+            agent_id: Agent ID for access control
+
+        Returns:
+            Dictionary mapping memory id to normalized memory data;
+            ids that could not be fetched are simply absent
+        """
+        if not memory_ids:
+            return {}
+
+        wanted = set(memory_ids)
+        try:
+            result = self.memory.get_all(
+                user_id=user_id,
+                agent_id=agent_id,
+                limit=max(len(wanted), 100),
+                sort_by="created_at",
+                order="desc",
+            )
+        except Exception as e:
+            logger.warning(f"Batch fetch of {len(wanted)} memories failed: {e}")
+            return {}
+
+        fetched = {}
+        for m in result.get("results", []):
+            mid = m.get("id")
+            if mid not in wanted:
+                continue
+            # get_all returns the content under "memory"; normalize to the
+            # same shape get_memory produces
+            fetched[mid] = {
+                "id": mid,
+                "memory_id": mid,
+                "content": m.get("memory") or m.get("content") or "",
+                "user_id": m.get("user_id"),
+                "agent_id": m.get("agent_id"),
+                "run_id": m.get("run_id"),
+                "metadata": m.get("metadata") if isinstance(m.get("metadata"), dict) else {},
+                "created_at": m.get("created_at"),
+                "updated_at": m.get("updated_at"),
+            }
+        return fetched
+
     def create_memory(
         self,
         content: str,
@@ -84,63 +235,57 @@ class MemoryService:
                 logger.info("No memories were created (likely duplicates detected or no facts extracted)")
                 return []
             
-            logger.info(f"Created {len(all_results)} memory/memories")
+            logger.info("Created %d memory/memories", len(all_results))
             
             # Normalize all results to include memory_id and other fields at top level
             # Fetch full memory info from database to get timestamps (consistent with batch_create_memories)
+            # One batched lookup instead of a get_memory round-trip per result
+            memory_ids = [r.get("id") for r in all_results if r.get("id") is not None]
+            fetched = self._batch_get_memories(memory_ids, user_id, agent_id)
+
             normalized_memories = []
-            
+
             for result_item in all_results:
                 memory_id = result_item.get("id")
                 if memory_id is None:
                     continue
-                
-                # Fetch full memory info from database to get complete data including timestamps
-                try:
-                    full_memory = self.get_memory(memory_id, user_id, agent_id)
-                    if full_memory:
-                        normalized_memories.append(full_memory)
-                        continue
-                except Exception as e:
-                    logger.warning(f"Failed to fetch full memory info for {memory_id}: {e}, using result_item data")
-                
-                # Fallback to result_item if get_memory fails
+
+                full_memory = fetched.get(memory_id)
+                if full_memory:
+                    normalized_memories.append(full_memory)
+                    continue
+
+                # Fallback to result_item if the batched fetch missed this id
                 # Ensure metadata is always a dict, never None
                 result_metadata = result_item.get("metadata")
                 if result_metadata is None:
                     result_metadata = metadata or {}
-                
-                # Extract fields with fallback: use result_item value if present and not None, otherwise use input parameter
-                def get_field(result_key: str, param_value):
-                    """Get field from result_item if available and not None, otherwise use param_value"""
-                    if result_key in result_item:
-                        result_value = result_item.get(result_key)
-                        # Use result value if it's not None, otherwise fall back to param
-                        return result_value if result_value is not None else param_value
-                    return param_value
-                
+
+                # Single dict literal with result-value-or-input-param
+                # fallbacks; no per-field closure calls on this hot path
                 normalized_memory = {
                     "id": memory_id,
                     "memory_id": memory_id,
-                    "content": get_field("memory", content),
-                    "user_id": get_field("user_id", user_id),
-                    "agent_id": get_field("agent_id", agent_id),
-                    "run_id": get_field("run_id", run_id),
+                    "content": result_item.get("memory") or content,
+                    "user_id": result_item.get("user_id") or user_id,
+                    "agent_id": result_item.get("agent_id") or agent_id,
+                    "run_id": result_item.get("run_id") or run_id,
                     "metadata": result_metadata if isinstance(result_metadata, dict) else {},
                 }
-                
+
                 # Add timestamps only if they exist and are not None
-                if "created_at" in result_item and result_item["created_at"] is not None:
-                    normalized_memory["created_at"] = result_item["created_at"]
-                if "updated_at" in result_item and result_item["updated_at"] is not None:
-                    normalized_memory["updated_at"] = result_item["updated_at"]
-                
+                for key in ("created_at", "updated_at"):
+                    value = result_item.get(key)
+                    if value is not None:
+                        normalized_memory[key] = value
+
                 normalized_memories.append(normalized_memory)
             
             # Record successful memory operation
-            metrics_collector = get_metrics_collector()
-            metrics_collector.record_memory_operation("create", "success")
-            
+            self._metrics.record_memory_operation("create", "success")
+
+            self._invalidate_read_cache(user_id, agent_id)
+
             # Return array of all created memories
             return normalized_memories
             
@@ -148,8 +293,7 @@ class MemoryService:
             logger.error(f"Failed to create memory: {e}", exc_info=True)
             
             # Record failed memory operation
-            metrics_collector = get_metrics_collector()
-            metrics_collector.record_memory_operation("create", "failed")
+            self._metrics.record_memory_operation("create", "failed")
             
             raise APIError(
                 code=ErrorCode.MEMORY_CREATE_FAILED,
@@ -243,6 +387,24 @@ class MemoryService:
             List of memories
         """
         try:
+            # Cache filterless listings (the shape dashboards re-poll);
+            # the epoch in the key makes writes visible immediately
+            cache_key = None
+            if filters is None:
+                cache_key = (
+                    "list",
+                    user_id or "",
+                    agent_id or "",
+                    limit,
+                    offset,
+                    sort_by,
+                    order,
+                    self._cache_epoch(user_id, agent_id),
+                )
+                cached = self._read_cache_get(cache_key)
+                if cached is not None:
+                    return cached
+
             result = self.memory.get_all(
                 user_id=user_id,
                 agent_id=agent_id,
@@ -256,7 +418,19 @@ class MemoryService:
             # Extract results from the dictionary response
             # get_all returns {"results": [...], "relations": [...]}
             memories_list = result.get("results", [])
-            
+
+            # Trust the backend contract (list of dicts) and skip the O(N)
+            # per-item isinstance scan on this hot read path
+            if self._trust_backend_types:
+                if not isinstance(memories_list, list):
+                    logger.warning(
+                        f"Backend returned non-list results: {type(memories_list)}"
+                    )
+                    return []
+                if cache_key is not None:
+                    self._read_cache_put(cache_key, memories_list)
+                return memories_list
+
             # Filter out non-dict items and ensure all items are dictionaries
             filtered_memories = []
             for item in memories_list:
@@ -264,7 +438,7 @@ class MemoryService:
                     filtered_memories.append(item)
                 else:
                     logger.warning(f"Skipping non-dict item in memories list: {type(item)} - {item}")
-            
+
             return filtered_memories
             
         except Exception as e:
@@ -312,47 +486,48 @@ class MemoryService:
         user_id: Optional[str] = None,
         agent_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        merge_metadata: bool = True,
     ) -> Dict[str, Any]:
         """
         Update a memory.
-        
+
         Args:
             memory_id: Memory ID
             content: New content (optional)
             user_id: User ID for access control
             agent_id: Agent ID for access control
             metadata: Updated metadata (optional)
-            
+            merge_metadata: Merge metadata into the existing metadata
+                (default). When False, metadata replaces the stored
+                metadata outright and the pre-update fetch is skipped.
+
         Returns:
             Updated memory data
-            
+
         Raises:
             APIError: If update fails
         """
         try:
-            # First check if memory exists
-            existing = self.get_memory(memory_id, user_id, agent_id)
-            if existing is None:
-                raise APIError(
-                    code=ErrorCode.MEMORY_NOT_FOUND,
-                    message=f"Memory not found: {memory_id}",
-                    status_code=404,
-                )
-            
             # At least one of content or metadata must be provided
             if content is None and metadata is None:
                 raise ValueError("At least one of content or metadata must be provided")
-            
-            # Use existing content if new content not provided
-            final_content = content if content is not None else existing.get("content", "")
-            
-            # Merge metadata if both existing and new metadata exist
+
+            final_content = content
             final_metadata = metadata
-            if metadata is not None and existing.get("metadata"):
-                final_metadata = {**existing.get("metadata", {}), **metadata}
-            elif existing.get("metadata"):
-                final_metadata = existing.get("metadata")
-            
+
+            # Fetch the existing row only when its data is actually needed:
+            # to fill in unchanged content or to merge a metadata patch.
+            # Memory.update itself preserves stored metadata when none is
+            # passed and fails on unknown ids, so the extra round-trip is
+            # pure overhead otherwise.
+            if content is None or (metadata is not None and merge_metadata):
+                existing = self.get_memory(memory_id, user_id, agent_id)
+
+                if content is None:
+                    final_content = existing.get("content", "")
+                if metadata is not None and merge_metadata and existing.get("metadata"):
+                    final_metadata = {**existing.get("metadata", {}), **metadata}
+
             result = self.memory.update(
                 memory_id=memory_id,
                 content=final_content,
@@ -372,7 +547,8 @@ class MemoryService:
                 result["id"] = memory_id
                 result["memory_id"] = memory_id
             
-            logger.info(f"Memory updated: {memory_id}")
+            logger.info("Memory updated: %s", memory_id)
+            self._invalidate_read_cache(user_id, agent_id)
             return result
             
         except APIError:
@@ -392,28 +568,46 @@ class MemoryService:
         cutoff_date: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Get memory statistics with optional time filtering (same logic as CLI via shared stats)."""
-        from powermem.utils.stats import _parse_datetime_for_stats, calculate_stats_from_memories
+        from powermem.utils.stats import calculate_stats_from_memories
+
+        # Bucket the cutoff to minute granularity so "last 7 days" style
+        # callers computed moments apart share a cache entry
+        cache_key = (
+            "stats",
+            user_id or "",
+            agent_id or "",
+            cutoff_date.replace(second=0, microsecond=0) if cutoff_date else None,
+            self._cache_epoch(user_id, agent_id),
+        )
+        cached = self._read_cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        all_memories = self.memory.get_all(
+        # Page through the backend instead of fetching 10K rows up front;
+        # with a cutoff, iter_all stops paging at the first row older than
+        # it, so discarded rows are never transferred
+        all_memories: List[Dict[str, Any]] = []
+        for page in self.memory.iter_all(
             user_id=user_id,
             agent_id=agent_id,
-            limit=10000,
-        ).get("results", [])
-
-        if cutoff_date is not None:
-            filtered = [
-                m for m in all_memories
-                if (parsed := _parse_datetime_for_stats(m.get("created_at"))) is not None
-                and parsed >= cutoff_date
-            ]
-            return calculate_stats_from_memories(filtered)
+            created_after=cutoff_date,
+            page_size=500,
+        ):
+            all_memories.extend(page)
 
         stats = calculate_stats_from_memories(all_memories)
+        self._read_cache_put(cache_key, stats)
         return stats
 
     def get_users(self) -> List[str]:
         """Get a list of unique user IDs"""
-        return self.memory.get_users()
+        cache_key = ("users", self._cache_epoch(None, None))
+        cached = self._read_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        users = self.memory.get_users()
+        self._read_cache_put(cache_key, users)
+        return users
 
     def delete_memory(
         self,
@@ -436,23 +630,24 @@ class MemoryService:
             APIError: If deletion fails
         """
         try:
-            # First check if memory exists
-            self.get_memory(memory_id, user_id, agent_id)
-            
+            # No pre-fetch existence check: the storage layer reports a
+            # missing/inaccessible id by returning False, so one delete
+            # round-trip is enough
             success = self.memory.delete(
                 memory_id=memory_id,
                 user_id=user_id,
                 agent_id=agent_id,
             )
-            
+
             if not success:
                 raise APIError(
-                    code=ErrorCode.MEMORY_DELETE_FAILED,
-                    message=f"Failed to delete memory {memory_id}",
-                    status_code=500,
+                    code=ErrorCode.MEMORY_NOT_FOUND,
+                    message=f"Memory {memory_id} not found",
+                    status_code=404,
                 )
             
-            logger.info(f"Memory deleted: {memory_id}")
+            logger.info("Memory deleted: %s", memory_id)
+            self._invalidate_read_cache(user_id, agent_id)
             return True
             
         except APIError:
@@ -465,6 +660,49 @@ class MemoryService:
                 status_code=500,
             )
     
+    def delete_all_memories(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ) -> Any:
+        """
+        Delete all memories matching the filters.
+
+        Args:
+            user_id: Filter by user ID
+            agent_id: Filter by agent ID
+            run_id: Filter by run ID
+
+        Returns:
+            The backend delete_all result
+
+        Raises:
+            APIError: If deletion fails
+        """
+        try:
+            result = self.memory.delete_all(
+                user_id=user_id,
+                agent_id=agent_id,
+                run_id=run_id,
+            )
+
+            logger.info(
+                "All memories deleted (user_id=%s, agent_id=%s, run_id=%s)",
+                user_id, agent_id, run_id,
+            )
+            # Partial filters can span every read scope; drop the whole cache
+            self._invalidate_all_read_caches()
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to delete all memories: {e}", exc_info=True)
+            raise APIError(
+                code=ErrorCode.INTERNAL_ERROR,
+                message=f"Failed to delete all memories: {str(e)}",
+                status_code=500,
+            )
+
     def bulk_delete_memories(
         self,
         memory_ids: List[int],
@@ -484,14 +722,30 @@ class MemoryService:
         """
         deleted = []
         failed = []
-        
-        for memory_id in memory_ids:
-            try:
-                self.delete_memory(memory_id, user_id, agent_id)
-                deleted.append(memory_id)
-            except APIError as e:
-                failed.append({"memory_id": memory_id, "error": e.message})
-        
+
+        # Deletes are I/O-bound on the vector store; fan them out instead of
+        # paying the round-trips serially
+        max_workers = min(server_config.bulk_worker_pool_size, max(len(memory_ids), 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.delete_memory, memory_id, user_id, agent_id): memory_id
+                for memory_id in memory_ids
+            }
+            for future in as_completed(futures):
+                memory_id = futures[future]
+                try:
+                    future.result()
+                    deleted.append(memory_id)
+                except APIError as e:
+                    failed.append({"memory_id": memory_id, "error": e.message})
+                except Exception as e:
+                    failed.append({"memory_id": memory_id, "error": str(e)})
+
+        # Keep results in request order despite completion-order collection
+        order = {memory_id: idx for idx, memory_id in enumerate(memory_ids)}
+        deleted.sort(key=order.get)
+        failed.sort(key=lambda item: order.get(item["memory_id"], 0))
+
         return {
             "deleted": deleted,
             "failed": failed,
@@ -526,9 +780,14 @@ class MemoryService:
         Returns:
             Dictionary with creation results
         """
+        # Without inference there is no per-item LLM pipeline, so the whole
+        # batch can go through the vectorized add_batch path
+        if not infer:
+            return self._batch_create_simple(memories, user_id, agent_id, run_id)
+
         created = []
         failed = []
-        
+
         for idx, memory_item in enumerate(memories):
             try:
                 content = memory_item.get("content")
@@ -573,13 +832,24 @@ class MemoryService:
                 })
                 
             except Exception as e:
-                logger.error(f"Failed to create memory at index {idx}: {e}", exc_info=True)
+                # Lazy %-format and no per-item traceback: individual
+                # failures are returned in the failed list, and one
+                # aggregated error is logged after the loop
+                logger.error("Failed to create memory at index %d: %s", idx, e)
                 failed.append({
                     "index": idx,
                     "content": memory_item.get("content", "N/A"),
                     "error": str(e),
                 })
-        
+
+        if failed:
+            logger.error(
+                "Batch create finished with %d/%d failures", len(failed), len(memories)
+            )
+
+        if created:
+            self._invalidate_read_cache(user_id, agent_id)
+
         return {
             "created": created,
             "failed": failed,
@@ -587,7 +857,98 @@ class MemoryService:
             "created_count": len(created),
             "failed_count": len(failed),
         }
-    
+
+    def _batch_create_simple(
+        self,
+        memories: List[Dict[str, Any]],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Batch creation path for infer=False.
+
+        Items are grouped by (scope, memory_type, filters) and each group
+        is created with a single Memory.add_batch call, so embeddings are
+        generated in one batched request per group instead of one per item.
+        """
+        created = []
+        failed = []
+
+        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        for idx, memory_item in enumerate(memories):
+            content = memory_item.get("content")
+            if not content:
+                failed.append({
+                    "index": idx,
+                    "content": memory_item.get("content", "N/A"),
+                    "error": "Memory content is required",
+                })
+                continue
+
+            filters = memory_item.get("filters")
+            key = (
+                memory_item.get("scope"),
+                memory_item.get("memory_type"),
+                json.dumps(filters, sort_keys=True) if filters else None,
+            )
+            groups.setdefault(key, []).append({
+                "index": idx,
+                "content": content,
+                "metadata": memory_item.get("metadata"),
+                "filters": filters,
+            })
+
+        for (scope, memory_type, _), entries in groups.items():
+            try:
+                result = self.memory.add_batch(
+                    [entry["content"] for entry in entries],
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    run_id=run_id,
+                    metadata_list=[entry["metadata"] for entry in entries],
+                    filters=entries[0]["filters"],
+                    scope=scope,
+                    memory_type=memory_type,
+                )
+                results = result.get("results", [])
+                for entry, result_item in zip(entries, results):
+                    memory_id = result_item.get("id")
+                    if memory_id is None:
+                        failed.append({
+                            "index": entry["index"],
+                            "content": entry["content"],
+                            "error": "Failed to extract memory_id from result",
+                        })
+                    else:
+                        created.append({
+                            "index": entry["index"],
+                            "memory_id": memory_id,
+                            "content": entry["content"],
+                        })
+            except Exception as e:
+                logger.error("Failed to batch create %d memories: %s", len(entries), e, exc_info=True)
+                for entry in entries:
+                    failed.append({
+                        "index": entry["index"],
+                        "content": entry["content"],
+                        "error": str(e),
+                    })
+
+        created.sort(key=lambda item: item["index"])
+        failed.sort(key=lambda item: item["index"])
+
+        if created:
+            self._invalidate_read_cache(user_id, agent_id)
+
+        return {
+            "created": created,
+            "failed": failed,
+            "total": len(memories),
+            "created_count": len(created),
+            "failed_count": len(failed),
+        }
+
     def batch_update_memories(
         self,
         updates: List[Dict[str, Any]],
@@ -610,23 +971,33 @@ class MemoryService:
         """
         updated = []
         failed = []
-        
+
+        # One batched lookup for the existing rows instead of a get_memory
+        # round-trip per item; ids the batch misses fall back below
+        prefetch_ids = [
+            item.get("memory_id") for item in updates
+            if item.get("memory_id") is not None
+        ]
+        fetched = self._batch_get_memories(prefetch_ids, user_id, agent_id)
+
         for idx, update_item in enumerate(updates):
             try:
                 memory_id = update_item.get("memory_id")
                 if memory_id is None:
                     raise ValueError("memory_id is required for each update")
-                
+
                 content = update_item.get("content")
                 metadata = update_item.get("metadata")
-                
+
                 # At least one of content or metadata must be provided
                 if content is None and metadata is None:
                     raise ValueError("At least one of content or metadata must be provided")
-                
-                # Get existing memory to merge metadata if needed
-                existing = self.get_memory(memory_id, user_id, agent_id)
-                
+
+                # Existing memory for content fill / metadata merge
+                existing = fetched.get(memory_id)
+                if existing is None:
+                    existing = self.get_memory(memory_id, user_id, agent_id)
+
                 # Merge metadata if both existing and new metadata exist
                 final_metadata = metadata
                 if metadata is not None and existing.get("metadata"):
@@ -651,20 +1022,29 @@ class MemoryService:
                 })
                 
             except APIError as e:
-                logger.error(f"Failed to update memory at index {idx}: {e}", exc_info=True)
+                # Lazy %-format and no per-item traceback; see batch create
+                logger.error("Failed to update memory at index %d: %s", idx, e)
                 failed.append({
                     "index": idx,
                     "memory_id": update_item.get("memory_id"),
                     "error": e.message,
                 })
             except Exception as e:
-                logger.error(f"Failed to update memory at index {idx}: {e}", exc_info=True)
+                logger.error("Failed to update memory at index %d: %s", idx, e)
                 failed.append({
                     "index": idx,
                     "memory_id": update_item.get("memory_id"),
                     "error": str(e),
                 })
-        
+
+        if failed:
+            logger.error(
+                "Batch update finished with %d/%d failures", len(failed), len(updates)
+            )
+
+        if updated:
+            self._invalidate_read_cache(user_id, agent_id)
+
         return {
             "updated": updated,
             "failed": failed,
@@ -695,80 +1075,140 @@ class MemoryService:
                 - quality_criteria: Distribution of quality issues
         """
         try:
-            from powermem.utils.stats import _extract_importance, _parse_datetime_for_stats
+            from powermem.utils.stats import _extract_importance
 
-            # Get all memories (without pagination limit for analysis)
-            result = self.memory.get_all(
+            cache_key = (
+                "quality",
+                user_id or "",
+                agent_id or "",
+                cutoff_date.replace(second=0, microsecond=0) if cutoff_date else None,
+                self._cache_epoch(user_id, agent_id),
+            )
+            cached = self._read_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Fast path: backends with SQL-side aggregation return only the
+            # counts, skipping the row transfer and the Python loop entirely.
+            # Time-filtered requests still use the paging path below.
+            if cutoff_date is None:
+                counts = self.memory.quality_counts(user_id=user_id, agent_id=agent_id)
+                if counts is not None:
+                    total = counts.get("total", 0)
+                    if total == 0:
+                        # Empty tenants are common and poll frequently; cache
+                        # the zero result so follow-up calls skip the count too
+                        analysis = {
+                            "total_memories": 0,
+                            "low_quality_count": 0,
+                            "low_quality_ratio": 0.0,
+                            "quality_criteria": {},
+                        }
+                        self._read_cache_put(cache_key, analysis)
+                        return analysis
+                    low_quality = counts.get("low_quality", 0)
+                    analysis = {
+                        "total_memories": total,
+                        "low_quality_count": low_quality,
+                        "low_quality_ratio": round(low_quality / total, 4),
+                        "quality_criteria": {
+                            "missing_metadata": counts.get("missing_metadata", 0),
+                            "empty_content": counts.get("empty_content", 0),
+                            "low_importance": counts.get("low_importance", 0),
+                        },
+                    }
+                    self._read_cache_put(cache_key, analysis)
+                    return analysis
+
+            # Per-criterion counters; materialized into the quality_criteria
+            # dict once after the paging loop
+            missing_metadata_count = 0
+            empty_content_count = 0
+            low_importance_count = 0
+
+            total_memories = 0
+            low_quality_count = 0
+
+            # Page through the backend so peak memory stays O(page_size);
+            # iter_all stops paging at the first row older than the cutoff.
+            # Double-buffered: the next page is fetched on a worker thread
+            # while the current one is aggregated, so wall time approaches
+            # max(fetch, compute) instead of their sum.
+            pages = self.memory.iter_all(
                 user_id=user_id,
                 agent_id=agent_id,
-                limit=10000,  # High limit for comprehensive analysis
-                offset=0,
+                created_after=cutoff_date,
+                page_size=500,
             )
-            
-            memories_list = result.get("results", [])
-            
-            # Filter by cutoff_date if provided (same parsing as stats)
-            if cutoff_date:
-                memories_list = [
-                    m for m in memories_list
-                    if (parsed := _parse_datetime_for_stats(m.get("created_at"))) is not None
-                    and parsed >= cutoff_date
-                ]
-            
-            total_memories = len(memories_list)
-            
+            next_page = asyncio.create_task(asyncio.to_thread(next, pages, None))
+            while True:
+                page = await next_page
+                if page is None:
+                    break
+                next_page = asyncio.create_task(asyncio.to_thread(next, pages, None))
+                n = len(page)
+                total_memories += n
+
+                # One Python pass extracts the per-row fields into columns;
+                # the threshold comparisons, issue counts and the multi-issue
+                # dedup then run as NumPy mask reductions instead of per-row
+                # branches and dict increments
+                missing_meta = np.empty(n, dtype=bool)
+                content_lens = np.empty(n, dtype=np.int64)
+                importances = np.empty(n, dtype=np.float32)
+                for i, memory in enumerate(page):
+                    metadata = memory.get("metadata")
+                    missing_meta[i] = not metadata or (
+                        isinstance(metadata, dict) and len(metadata) == 0
+                    )
+                    # iter_all rows carry a canonical "content" key, so one
+                    # lookup suffices
+                    content_lens[i] = len(str(memory["content"]).strip())
+                    # Same extraction rule as stats; NaN marks "no importance
+                    # recorded" and compares False against the threshold
+                    importance = _extract_importance(memory)
+                    importances[i] = importance if importance is not None else np.nan
+
+                empty_content = content_lens < 5
+                low_importance = importances < 0.3
+                # A row with several issues bumps low_quality_count once
+                low_quality = missing_meta | empty_content | low_importance
+
+                missing_metadata_count += int(missing_meta.sum())
+                empty_content_count += int(empty_content.sum())
+                low_importance_count += int(low_importance.sum())
+                low_quality_count += int(low_quality.sum())
+
             if total_memories == 0:
-                return {
+                analysis = {
                     "total_memories": 0,
                     "low_quality_count": 0,
                     "low_quality_ratio": 0.0,
                     "quality_criteria": {},
                 }
-            
-            # Quality criteria counters
-            quality_issues = {
-                "missing_metadata": 0,
-                "empty_content": 0,
-                "low_importance": 0,
-            }
-            
-            low_quality_memories = set()  # Use set to avoid counting same memory twice
-            
-            for memory in memories_list:
-                memory_id = memory.get("id") or memory.get("memory_id")
-                
-                # Check for missing or empty metadata
-                metadata = memory.get("metadata")
-                if not metadata or (isinstance(metadata, dict) and len(metadata) == 0):
-                    quality_issues["missing_metadata"] += 1
-                    low_quality_memories.add(memory_id)
-                
-                # Check for empty or very short content
-                # Note: get_all() returns 'memory' field, not 'content'
-                content = memory.get("memory") or memory.get("content") or memory.get("data") or ""
-                content_len = len(str(content).strip())
-                if content_len < 5:
-                    quality_issues["empty_content"] += 1
-                    low_quality_memories.add(memory_id)
-                
-                # Check for low importance using the same extraction rule as stats.
-                importance = _extract_importance(memory)
-                if importance is not None and importance < 0.3:
-                    quality_issues["low_importance"] += 1
-                    low_quality_memories.add(memory_id)
-            
-            low_quality_count = len(low_quality_memories)
+                self._read_cache_put(cache_key, analysis)
+                return analysis
+
             low_quality_ratio = low_quality_count / total_memories if total_memories > 0 else 0.0
             
-            logger.info(f"Quality analysis complete: {low_quality_count}/{total_memories} low quality memories")
+            logger.info(
+                "Quality analysis complete: %d/%d low quality memories",
+                low_quality_count, total_memories,
+            )
             
-            return {
+            analysis = {
                 "total_memories": total_memories,
                 "low_quality_count": low_quality_count,
                 "low_quality_ratio": round(low_quality_ratio, 4),
-                "quality_criteria": quality_issues,
+                "quality_criteria": {
+                    "missing_metadata": missing_metadata_count,
+                    "empty_content": empty_content_count,
+                    "low_importance": low_importance_count,
+                },
             }
-            
+            self._read_cache_put(cache_key, analysis)
+            return analysis
+
         except Exception as e:
             logger.error(f"Failed to analyze memory quality: {e}", exc_info=True)
             raise APIError(
@@ -25,6 +25,9 @@ class SearchService:
             config = auto_config()
         
         self.memory = Memory(config=config)
+        # Resolved once: the collector is a process-wide singleton, no need
+        # to go through the registry lookup on every operation
+        self._metrics = get_metrics_collector()
         logger.info("SearchService initialized")
     
     def search_memories(
@@ -73,23 +76,20 @@ class SearchService:
             logger.info(f"Search completed: {len(results.get('results', []))} results")
             
             # Record successful memory operation
-            metrics_collector = get_metrics_collector()
-            metrics_collector.record_memory_operation("search", "success")
+            self._metrics.record_memory_operation("search", "success")
             
             return results
             
         except APIError:
             # Record failed memory operation for API errors
-            metrics_collector = get_metrics_collector()
-            metrics_collector.record_memory_operation("search", "failed")
+            self._metrics.record_memory_operation("search", "failed")
             raise
         except Exception as e:
             logger.error(f"Search failed: {e}", exc_info=True)
             
             # Record failed memory operation
-            metrics_collector = get_metrics_collector()
-            metrics_collector.record_memory_operation("search", "failed")
-            
+            self._metrics.record_memory_operation("search", "failed")
+
             raise APIError(
                 code=ErrorCode.SEARCH_FAILED,
                 message=f"Search failed: {str(e)}",
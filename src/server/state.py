@@ -2,7 +2,12 @@
 Server state management
 """
 
+import time
 from datetime import datetime, timezone
 
 # Track server start time
 SERVER_START_TIME = datetime.now(timezone.utc)
+
+# Monotonic reference for uptime calculation (immune to wall-clock jumps
+# and cheaper than datetime arithmetic on hot endpoints)
+SERVER_START_MONO = time.monotonic()
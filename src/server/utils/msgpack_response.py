@@ -0,0 +1,29 @@
+"""
+msgpack response class for FastAPI
+
+msgpack encodes faster and produces smaller payloads than JSON for
+nested dict-heavy responses, which benefits monitoring scrapers that
+poll the status endpoint. Clients opt in via the Accept header
+(application/vnd.msgpack).
+"""
+
+from typing import Any
+
+import msgspec
+from fastapi import Response
+
+MSGPACK_MEDIA_TYPE = "application/vnd.msgpack"
+
+
+class MsgpackResponse(Response):
+    """Response that renders content as msgpack via msgspec."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.msgpack.encode(content)
+
+
+def wants_msgpack(accept_header: str) -> bool:
+    """Check whether the client's Accept header requests msgpack."""
+    return MSGPACK_MEDIA_TYPE in accept_header
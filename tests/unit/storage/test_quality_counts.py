@@ -0,0 +1,56 @@
+"""Unit tests for SQL-side quality aggregation in SQLiteVectorStore."""
+
+import pytest
+
+from powermem.storage.sqlite.sqlite_vector_store import SQLiteVectorStore
+
+
+@pytest.fixture
+def store():
+    """Create an in-memory SQLiteVectorStore for testing."""
+    s = SQLiteVectorStore(database_path=":memory:", collection_name="test_quality")
+    yield s
+    s.close()
+
+
+def _insert(store, payloads):
+    dim = 4
+    store.insert([[0.0] * dim] * len(payloads), payloads=payloads)
+
+
+class TestQualityCounts:
+    def test_empty_store(self, store):
+        counts = store.quality_counts()
+        assert counts == {
+            "total": 0,
+            "missing_metadata": 0,
+            "empty_content": 0,
+            "low_importance": 0,
+            "low_quality": 0,
+        }
+
+    def test_counts_each_criterion(self, store):
+        _insert(store, [
+            {"data": "long enough content", "user_id": "u1", "metadata": {"importance": 0.9}},
+            # short content AND empty metadata: one row, two criteria
+            {"data": "hi", "user_id": "u1", "metadata": {}},
+            {"data": "another fine memory", "user_id": "u1",
+             "metadata": {"intelligence": {"importance_score": 0.1}}},
+            {"data": "fine one here", "user_id": "u2", "metadata": None},
+        ])
+        counts = store.quality_counts()
+        assert counts["total"] == 4
+        assert counts["missing_metadata"] == 2
+        assert counts["empty_content"] == 1
+        assert counts["low_importance"] == 1
+        # Row 2 has two issues but is counted once
+        assert counts["low_quality"] == 3
+
+    def test_filters_scope_the_counts(self, store):
+        _insert(store, [
+            {"data": "ok content here", "user_id": "u1", "metadata": {"k": "v"}},
+            {"data": "x", "user_id": "u2", "metadata": {}},
+        ])
+        counts = store.quality_counts(filters={"user_id": "u1"})
+        assert counts["total"] == 1
+        assert counts["low_quality"] == 0
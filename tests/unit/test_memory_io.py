@@ -0,0 +1,104 @@
+"""
+Test cases for memory import/export utilities (powermem.utils.io)
+"""
+
+from datetime import datetime, timezone
+
+from powermem.utils.io import (
+    export_to_json,
+    export_to_csv,
+    import_from_json,
+    import_from_csv,
+    iter_csv,
+)
+
+
+class TestJsonExportImport:
+    """Test cases for JSON export/import round-trips."""
+
+    def test_json_round_trip(self):
+        memories = [
+            {
+                "id": 1,
+                "content": "User likes coffee",
+                "role": "user",
+                "metadata": {"category": "preference"},
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "updated_at": None,
+            }
+        ]
+        json_str = export_to_json(memories)
+        imported = import_from_json(json_str)
+        assert len(imported) == 1
+        assert imported[0]["content"] == "User likes coffee"
+        assert imported[0]["metadata"] == {"category": "preference"}
+
+    def test_export_handles_datetime(self):
+        memories = [{"id": 1, "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc)}]
+        json_str = export_to_json(memories)
+        assert "2025-01-01" in json_str
+
+    def test_export_compact_by_default(self):
+        memories = [{"id": 1, "content": "a"}]
+        assert "\n" not in export_to_json(memories)
+        assert "\n" in export_to_json(memories, pretty=True)
+
+    def test_import_skips_non_dict_items(self):
+        imported = import_from_json('[{"content": "a"}, "not-a-dict", 42]')
+        assert len(imported) == 1
+        assert imported[0]["content"] == "a"
+
+    def test_import_accepts_bytes(self):
+        imported = import_from_json(b'[{"content": "a"}]')
+        assert imported[0]["content"] == "a"
+
+    def test_import_applies_defaults(self):
+        imported = import_from_json('[{"content": "a"}]')
+        assert imported[0]["role"] == "user"
+        assert imported[0]["metadata"] == {}
+        assert imported[0]["id"] is None
+
+
+class TestCsvExportImport:
+    """Test cases for CSV export/import round-trips."""
+
+    def test_csv_round_trip(self):
+        memories = [
+            {
+                "id": 1,
+                "content": "User likes tea",
+                "role": "user",
+                "metadata": {"category": "preference"},
+                "created_at": "2025-01-01T00:00:00",
+                "updated_at": "2025-01-02T00:00:00",
+            }
+        ]
+        csv_str = export_to_csv(memories)
+        imported = import_from_csv(csv_str)
+        assert len(imported) == 1
+        assert imported[0]["content"] == "User likes tea"
+        assert imported[0]["metadata"] == {"category": "preference"}
+
+    def test_csv_export_empty_list(self):
+        assert export_to_csv([]) == ""
+
+    def test_csv_import_empty_string(self):
+        assert import_from_csv("") == []
+
+    def test_iter_csv_yields_bytes_matching_export(self):
+        memories = [
+            {"id": 1, "content": "a", "metadata": {"k": "v"}},
+            {"id": 2, "content": "b"},
+        ]
+        chunks = list(iter_csv(memories))
+        assert all(isinstance(c, bytes) for c in chunks)
+        assert len(chunks) == 3  # header + one chunk per row
+        assert b"".join(chunks).decode() == export_to_csv(memories)
+
+    def test_iter_csv_empty(self):
+        assert list(iter_csv([])) == []
+
+    def test_csv_import_missing_metadata(self):
+        csv_str = "id,content,role,metadata,created_at,updated_at\n1,hello,user,,,\n"
+        imported = import_from_csv(csv_str)
+        assert imported[0]["metadata"] == {}